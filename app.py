@@ -1,55 +1,108 @@
 """Main application module for the Mission Computer Simulator (MCS)."""
 
+from __future__ import annotations
+
 import asyncio
 import logging
-from typing import Dict, Optional, Type, TYPE_CHECKING
+from collections import OrderedDict, deque
+from functools import cached_property
+from types import MappingProxyType
+from typing import Callable, Mapping, TYPE_CHECKING
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 from textual.app import App, ComposeResult
 from textual.screen import Screen
+from textual.worker import Worker
 from textual.widgets import Header, Footer
 
-from config import DEFAULT_HOST, DEFAULT_PORT, THEME_DARK, THEME_LIGHT
-from interrogations import Interrogations
-from main_menu import Menu
+from config import (
+    CLIENT_POOL_SIZE,
+    DEFAULT_HOST,
+    DEFAULT_PORT,
+    MESSAGE_BATCH_SIZE,
+    SEND_BATCH_DELAY,
+    SEND_BATCH_SIZE,
+    THEME_DARK,
+    THEME_LIGHT,
+)
 from message_handler import MessageHandler
 from network.client import TCPClient
+from serialization import dumps
 
 if TYPE_CHECKING:
     from main_menu import Menu
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
+logging.basicConfig(level=logging.WARNING)
 logger = logging.getLogger(__name__)
 
+# Theme to switch to when toggling from each theme
+_THEME_TOGGLE = {THEME_DARK: THEME_LIGHT, THEME_LIGHT: THEME_DARK}
+
+
+def _load_menu() -> Screen:
+    """Import and create the main menu screen the first time it is shown."""
+    from main_menu import Menu
+    return Menu()
+
+
+def _load_interrogations() -> Screen:
+    """Import and create the interrogations screen the first time it is shown."""
+    from interrogations import Interrogations
+    return Interrogations()
+
 
 class MCS(App):
     """Main application class for the Mission Computer Simulator."""
 
     # Class constants
     CSS_PATH = "main.tcss"
-    SCREENS: Dict[str, Type[Screen]] = {
-        "Main": Menu,
-        "Interrogations": Interrogations,
-    }
-    BINDINGS = [
+    SCREENS: Mapping[str, Callable[[], Screen]] = MappingProxyType({
+        "Main": _load_menu,
+        "Interrogations": _load_interrogations,
+    })
+    BINDINGS = (
         ("d", "toggle_dark", "Toggle dark mode"),
         ("i", "push_screen('Interrogations')", "Interrogations"),
         ("q", "quit", "Quit application"),
-    ]
+    )
 
     def __init__(self) -> None:
         """Initialize the MCS application."""
         super().__init__()
         self.theme = THEME_DARK
-        self.tcp_client: Optional[TCPClient] = None
+        self.tcp_client: TCPClient | None = None
+        # Clients keyed by endpoint, least recently used first
+        self._client_pool: OrderedDict[tuple[str, int], TCPClient] = OrderedDict()
         self.message_handler = MessageHandler()
-        self.main_menu: Optional[Menu] = None
-        self._network_worker = None  # Background network worker
+        self._main_menu_add_message: Callable[[dict], object] | None = None
+        # add_message of the active screen when it is not the main menu
+        self._active_add_message: Callable[[dict], object] | None = None
+        # Receive worker of each connected client, pooled ones included
+        self._receivers: dict[TCPClient, Worker] = {}
+        
+        # Received messages waiting to be dispatched on the next refresh
+        self._inbox: deque[dict] = deque()
+        self._drain_scheduled = False
+        
+        # Outbound frames waiting to be flushed in a single write
+        self._send_buf: list[bytes] = []
+        self._send_bytes = 0
+        self._send_flush_handle: asyncio.TimerHandle | None = None
         
         # Store default connection settings
         self.default_host = DEFAULT_HOST
         self.default_port = DEFAULT_PORT
 
+    @cached_property
+    def main_menu(self) -> Menu:
+        """The main menu screen, resolved on first access."""
+        return self.get_screen("Main")
+
     def compose(self) -> ComposeResult:
         """Compose the main application layout."""
         yield Header()
@@ -60,39 +113,70 @@ class MCS(App):
         """Configure the application when it's mounted."""
         self.title = "Mission Computer Simulator (MCS)"
         self.sub_title = "Disconnected"
-        self.main_menu = self.get_screen("Main")
-        self._start_network_worker()
+        self._main_menu_add_message = getattr(self.main_menu, 'add_message', None)
         logger.info("MCS application started")
 
     def on_unmount(self) -> None:
         """Clean up resources when the app is closed."""
         if self.tcp_client:
-            self.tcp_client.disconnect()
+            self._flush_send()
+        self._close_all_clients()
         logger.info("MCS application shutting down")
 
     # Network-related methods
     
-    def _start_network_worker(self) -> None:
-        """Start the network worker if not already running."""
-        if not self._network_worker or self._network_worker.is_finished:
-            self._network_worker = self.run_worker(
-                self._network_worker_task,
-                name="network_worker",
-                group="network",
-                exclusive=True,
-                exit_on_error=False,
-            )
-    
-    async def _network_worker_task(self) -> None:
-        """Background task to handle network operations."""
-        while True:
-            if self.tcp_client and hasattr(self.tcp_client, 'receive_data'):
-                self.tcp_client.receive_data()
-            await asyncio.sleep(0.01)  # Small sleep to prevent busy-waiting
-
-    def connect_to_server(self, host: str, port: int) -> bool:
+    def _start_receiving(self, client: TCPClient) -> None:
+        """Start a worker receiving from a newly connected client.
+
+        Each connected client keeps its worker while it is pooled, so a
+        parked connection is still read: its messages are dropped and a
+        close by the server is noticed instead of being found on reuse.
+        """
+        self._receivers[client] = self.run_worker(
+            self._receive(client),
+            name=f"receive {client.host}:{client.port}",
+            group="network",
+            exit_on_error=False,
+        )
+
+    async def _receive(self, client: TCPClient) -> None:
+        """Receive from a client until its connection closes.
+
+        The client suspends until its socket is readable, so the worker does
+        not wake up unless there is data to process.
+        """
+        try:
+            await client.receive_data()
+        finally:
+            # The client cancels the receive when it is disconnected elsewhere
+            if client is self.tcp_client and not client.is_alive():
+                self.sub_title = "Disconnected"
+
+    def _close_client(self, client: TCPClient) -> None:
+        """Stop receiving from a client and close its connection."""
+        # Cancel the worker first so it stops receiving before the socket closes
+        receiver = self._receivers.pop(client, None)
+        if receiver is not None:
+            receiver.cancel()
+        client.disconnect()
+
+    def _close_all_clients(self) -> None:
+        """Close the current connection and every pooled connection."""
+        if self.tcp_client:
+            self._close_client(self.tcp_client)
+        for client in self._client_pool.values():
+            self._close_client(client)
+        self._client_pool.clear()
+
+    async def connect_to_server(self, host: str, port: int) -> bool:
         """Connect to the TCP server.
         
+        Connections are pooled by endpoint, so reconnecting to a server that
+        still has a live connection reuses it instead of opening a new one.
+        Messages received by a pooled connection while another one was in
+        use are dropped. The blocking connect runs in a thread to keep the
+        UI responsive.
+        
         Args:
             host: Server hostname or IP address
             port: Server port number
@@ -102,32 +186,82 @@ class MCS(App):
         """
         try:
             if self.tcp_client:
-                self.tcp_client.disconnect()
+                self._flush_send()
+                self.tcp_client.park()
+            
+            endpoint = (host, port)
+            client = self._client_pool.get(endpoint)
+            if client is not None and client.is_alive():
+                logger.info("Reusing connection to %s:%s", host, port)
+                self._client_pool.move_to_end(endpoint)
+                client.unpark()
+                self.tcp_client = client
+                self.sub_title = f"Connected to {host}:{port}"
+                return True
             
+            # Reconnect a pooled client if there is one, keeping its buffers
             logger.info("Attempting to connect to %s:%s", host, port)
-            self.tcp_client = TCPClient(host, port, self._on_message_received)
+            if client is None:
+                client = TCPClient(host, port, self._on_message_received,
+                                   send_error_callback=self._on_send_error)
+            self.tcp_client = client
             
-            if self.tcp_client.connect():
+            if await asyncio.to_thread(client.connect):
+                self._add_to_client_pool(endpoint, self.tcp_client)
                 self.sub_title = f"Connected to {host}:{port}"
-                self._start_network_worker()
+                self._start_receiving(client)
                 logger.info("Successfully connected to server")
                 return True
             return False
             
         except Exception as e:
-            error_msg = f"Connection error: {str(e)}"
-            logger.error(error_msg)
-            self.notify(error_msg, severity="error")
+            logger.error("Connection error: %s", e)
+            self.notify(f"Connection error: {str(e)}", severity="error")
             return False
 
-    def send_message(self, message: Dict) -> bool:
-        """Send a message to the connected server.
+    def disconnect_from_server(self) -> None:
+        """Stop using the current server connection.
+        
+        The connection is parked in the client pool rather than closed, so
+        a later connect to the same endpoint reuses it. Pooled connections
+        are closed when they are evicted or when the app shuts down.
+        """
+        if not self.tcp_client:
+            return
+            
+        self._flush_send()
+        self.tcp_client.park()
+        self.tcp_client = None
+        self.sub_title = "Disconnected"
+
+    def _add_to_client_pool(self, endpoint: tuple[str, int], client: TCPClient) -> None:
+        """Add a connected client to the pool, evicting the least recently used.
+        
+        Args:
+            endpoint: (host, port) the client is connected to
+            client: Connected client to pool
+        """
+        stale = self._client_pool.pop(endpoint, None)
+        if stale is not None and stale is not client:
+            self._close_client(stale)
+            
+        self._client_pool[endpoint] = client
+        while len(self._client_pool) > CLIENT_POOL_SIZE:
+            _, evicted = self._client_pool.popitem(last=False)
+            self._close_client(evicted)
+
+    def send_message(self, message: dict) -> bool:
+        """Queue a message to be sent to the connected server.
+        
+        Messages are batched and flushed in a single write once
+        SEND_BATCH_SIZE bytes are queued or SEND_BATCH_DELAY has elapsed.
+        A flush that fails after this returns is reported with a notification.
         
         Args:
             message: Dictionary to send as JSON
             
         Returns:
-            bool: True if message was sent successfully, False otherwise
+            bool: True if message was queued or sent successfully, False otherwise
             
         Raises:
             ValueError: If message is not a dictionary
@@ -135,54 +269,113 @@ class MCS(App):
         if not isinstance(message, dict):
             raise ValueError("Message must be a dictionary")
             
-        if not self.tcp_client:
+        if not self.tcp_client or not self.tcp_client.is_alive():
             logger.warning("Cannot send message - not connected to server")
             return False
             
         try:
-            return self.tcp_client.send_message(message)
+            frame = self.tcp_client.frame(dumps(message))
+        except (TypeError, ValueError) as e:
+            logger.error("Failed to send message: %s", e)
+            self.notify(f"Failed to send message: {str(e)}", severity="error")
+            return False
+            
+        self._send_buf.append(frame)
+        self._send_bytes += len(frame)
+        
+        if self._send_bytes >= SEND_BATCH_SIZE:
+            return self._flush_send()
+            
+        if self._send_flush_handle is None:
+            self._send_flush_handle = asyncio.get_running_loop().call_later(
+                SEND_BATCH_DELAY, self._flush_send_deferred
+            )
+        return True
+
+    def _flush_send(self) -> bool:
+        """Send all queued frames to the server in a single write.
+        
+        Returns:
+            bool: True if the queued frames were sent successfully, False otherwise
+        """
+        if self._send_flush_handle is not None:
+            self._send_flush_handle.cancel()
+            self._send_flush_handle = None
+            
+        if not self._send_buf:
+            return True
+            
+        payload = b"".join(self._send_buf)
+        self._send_buf.clear()
+        self._send_bytes = 0
+        
+        if not self.tcp_client:
+            return False
+            
+        try:
+            return self.tcp_client.send_data(payload)
         except Exception as e:
-            error_msg = f"Failed to send message: {str(e)}"
-            logger.error(error_msg)
-            self.notify(error_msg, severity="error")
+            logger.error("Failed to send message: %s", e)
             return False
 
-    def _on_message_received(self, message: Dict) -> None:
+    def _flush_send_deferred(self) -> None:
+        """Flush the queued frames once SEND_BATCH_DELAY has elapsed.
+        
+        Nothing waits on the result of a timed flush, so a failure is
+        reported to the user here.
+        """
+        if not self._flush_send():
+            self.notify("Failed to send queued messages", severity="error")
+
+    def _on_send_error(self, error: Exception) -> None:
+        """Report a write that failed after the client accepted the data.
+        
+        Args:
+            error: The socket error that closed the connection
+        """
+        self.notify(f"Failed to send message: {error}", severity="error")
+
+    def _on_message_received(self, message: dict) -> None:
         """Handle an incoming message from the server.
         
+        Messages are queued and dispatched together after the next refresh,
+        so a burst of messages only schedules a single callback.
+        
         Args:
             message: Received message as a dictionary
         """
-        try:
-            # Process the message in a worker to avoid blocking the UI
-            self.run_worker(
-                self._process_message_worker(message),
-                name="message_processor",
-                group="message_processing",
-                exclusive=False,
-                exit_on_error=False
-            )
-            
-        except Exception as e:
-            logger.error("Error processing message: %s", e, exc_info=True)
+        self._inbox.append(message)
+        if not self._drain_scheduled:
+            self._drain_scheduled = True
+            self.call_after_refresh(self._drain_inbox)
 
-    async def _process_message_worker(self, message: Dict) -> None:
-        """Process a message in a worker thread."""
-        try:
-            # Update main menu if it exists and can handle messages
-            if self.main_menu and hasattr(self.main_menu, 'add_message'):
-                self.main_menu.add_message(message)
-            
-            # Also update current screen if it's different from main menu
-            current_screen = self.screen
-            if (current_screen is not self.main_menu and 
-                    hasattr(current_screen, 'add_message')):
-                current_screen.add_message(message)
-                
-        except Exception as e:
-            logger.error("Error processing message: %s", e, exc_info=True)
+    def _drain_inbox(self) -> None:
+        """Dispatch queued messages, up to MESSAGE_BATCH_SIZE per refresh."""
+        inbox = self._inbox
+        update_ui = self._update_ui_with_message
+        
+        # The active screen cannot change while the batch is dispatched
+        screen = self.screen
+        self._active_add_message = (
+            None if screen is self.main_menu else getattr(screen, 'add_message', None)
+        )
+        
+        with self.batch_update():
+            for _ in range(min(len(inbox), MESSAGE_BATCH_SIZE)):
+                message = inbox.popleft()
+                try:
+                    update_ui(message)
+                except Exception as e:
+                    logger.error("Error processing message: %s", e,
+                                 exc_info=logger.isEnabledFor(logging.DEBUG))
+        
+        if inbox:
+            # Leave the rest for the next refresh to keep the UI responsive
+            self.call_after_refresh(self._drain_inbox)
+        else:
+            self._drain_scheduled = False
 
-    def _process_message_data(self, message: Dict) -> Optional[Dict]:
+    def _process_message_data(self, message: dict) -> dict | None:
         """Process message data in background thread."""
         try:
             # Add any heavy processing here
@@ -191,27 +384,26 @@ class MCS(App):
             logger.error("Error processing message data: %s", e, exc_info=True)
             return None
 
-    def _update_ui_with_message(self, message: Dict) -> None:
+    def _update_ui_with_message(self, message: dict) -> None:
         """Update UI with processed message."""
         try:
-            # Update main menu if it exists and can handle messages
-            if self.main_menu and hasattr(self.main_menu, 'add_message'):
-                self.main_menu.add_message(message)
+            # Update main menu if it can handle messages
+            if self._main_menu_add_message is not None:
+                self._main_menu_add_message(message)
             
             # Also update current screen if it's different from main menu
-            current_screen = self.screen
-            if (current_screen is not self.main_menu and 
-                    hasattr(current_screen, 'add_message')):
-                current_screen.add_message(message)
+            if self._active_add_message is not None:
+                self._active_add_message(message)
                 
         except Exception as e:
-            logger.error("Error updating UI with message: %s", e, exc_info=True)
+            logger.error("Error updating UI with message: %s", e,
+                         exc_info=logger.isEnabledFor(logging.DEBUG))
 
     # Actions
     
     def action_toggle_dark(self) -> None:
         """Toggle between dark and light theme."""
-        self.theme = THEME_LIGHT if self.theme == THEME_DARK else THEME_DARK
+        self.theme = _THEME_TOGGLE.get(self.theme, THEME_DARK)
         logger.info("Theme toggled to %s", self.theme)
         
     def action_quit(self) -> None:
@@ -220,7 +412,13 @@ class MCS(App):
 
 
 def main() -> None:
-    """Run the MCS application."""
+    """Run the MCS application.
+    
+    When uvloop is installed it replaces the default asyncio event loop.
+    """
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        
     try:
         app = MCS()
         app.run()
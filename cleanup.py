@@ -1,21 +1,32 @@
 """Cleanup script for the MCS application."""
 
 import os
-import shutil
 from pathlib import Path
 
+def _remove_tree(directory: str) -> None:
+    """Remove a directory and everything below it."""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _remove_tree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(directory)
+
 def remove_pycache(directory: str) -> None:
     """Remove __pycache__ directories and .pyc files."""
-    for root, dirs, files in os.walk(directory):
-        # Remove __pycache__ directories
-        if "__pycache__" in dirs:
-            shutil.rmtree(os.path.join(root, "__pycache__"))
-            dirs.remove("__pycache__")
-        
-        # Remove .pyc files
-        for file in files:
-            if file.endswith(".pyc"):
-                os.remove(os.path.join(root, file))
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                # Remove __pycache__ directories, recurse into the rest
+                if entry.name == "__pycache__":
+                    _remove_tree(entry.path)
+                else:
+                    remove_pycache(entry.path)
+            
+            # Remove .pyc files
+            elif entry.name.endswith(".pyc"):
+                os.unlink(entry.path)
 
 def main() -> None:
     """Run the cleanup process."""
@@ -1,31 +1,47 @@
 """Configuration constants for the MCS application."""
-from typing import Dict, List, Tuple
+from types import MappingProxyType
+from typing import Mapping, Tuple
 
 # Network settings
 DEFAULT_HOST: str = "127.0.0.1"
 DEFAULT_PORT: int = 9000
 SOCKET_TIMEOUT: float = 0.1
 RECEIVE_BUFFER_SIZE: int = 4096
+SEND_BATCH_SIZE: int = 1400  # Flush outbound frames once roughly one MTU is queued
+SEND_BATCH_DELAY: float = 0.001  # Maximum time an outbound frame waits to be flushed
+CLIENT_POOL_SIZE: int = 4  # Connections kept open for reuse across reconnects
+KEEPALIVE_IDLE: int = 60  # Idle seconds before the first keepalive probe
+KEEPALIVE_INTERVAL: int = 10  # Seconds between unanswered keepalive probes
+KEEPALIVE_COUNT: int = 5  # Unanswered probes before the connection is dropped
+MESSAGE_BATCH_SIZE: int = 128  # Maximum received messages handled per UI refresh
+MESSAGE_FRAMING: str = "newline"  # "newline" or "length-prefix" (4-byte big-endian length)
+MAX_FRAME_SIZE: int = 16 * 1024 * 1024  # Largest received message; the connection is closed beyond it
+RECEIVE_BUSY_WAIT: bool = False  # Poll the socket instead of sleeping; lower latency, keeps a core busy
 
 # UI Settings
 THEME_DARK: str = "textual-dark"
 THEME_LIGHT: str = "textual-light"
 
 # Table Configuration
-TABLE_COLUMNS: List[Tuple[str, str]] = [
+TABLE_MAX_ROWS: int = 250  # Most recent messages kept in the data table
+TABLE_REFRESH_INTERVAL: float = 1 / 30  # Seconds between adding queued rows to the table
+TABLE_COLUMNS: Tuple[Tuple[str, str], ...] = (
     ("Message Name", "message_name"),
     ("Time", "time"),
     ("Raw", "raw"),
-]
+)
 
 # CSS Classes
-CSS_CLASSES = {
+CSS_CLASSES: Mapping[str, str] = MappingProxyType({
     "sidebar_label": "sidebar-label",
     "sidebar_container": "sidebar-container",
     "bordered_container": "bordered-container",
     "left_placeholder": "left-placeholder",
     "connection_container": "connection-container",
-}
+})
+
+# File Saving
+FILE_WRITE_BATCH_SIZE: int = 256  # Maximum queued messages written in a single call
 
 # Message Formats
 TIMESTAMP_FORMAT: str = "%H:%M:%S.%f"
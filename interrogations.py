@@ -1,12 +1,14 @@
 """Interrogations screen for the MCS application."""
 
+import logging
 from datetime import datetime, timezone
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 from textual import on
 from textual.app import ComposeResult
 from textual.containers import Container, VerticalScroll
 from textual.screen import Screen
+from textual.widget import Widget
 from textual.widgets import (
     Button,
     Checkbox,
@@ -21,6 +23,37 @@ from textual.widgets import (
     TabPane
 )
 
+from interrogations_pack import pack_mode_s_word
+
+logger = logging.getLogger(__name__)
+
+# Mode S grid Select options, shared by every tab
+_FORMAT_OPTIONS = tuple((str(opt), opt) for opt in (4, 5, 11, 17, 20, 21))
+_PROTOCOL_OPTIONS = tuple((str(opt), opt) for opt in (0, 1, 4, 5, 6))
+_DESIGNATOR_OPTIONS = tuple((str(opt), opt) for opt in (0, 1, 2, 3, 7))
+_RANGE4_OPTIONS = tuple((str(opt), opt) for opt in range(4))
+_RANGE5_OPTIONS = tuple((str(opt), opt) for opt in range(5))
+_RANGE8_OPTIONS = tuple((str(opt), opt) for opt in range(8))
+# Binary-labelled options for every 4-bit and 3-bit value
+_BIN4 = tuple((format(i, '04b'), i) for i in range(16))
+_BIN3 = tuple((format(i, '03b'), i) for i in range(8))
+_INTERROG_RATIO_OPTIONS = _BIN4[:11]
+_IIS_OPTIONS = _BIN4
+_TMS_OPTIONS = _BIN4
+_RRS_OPTIONS = _BIN4
+_CODE_LABEL_OPTIONS = _BIN3[:5]
+
+# Mode S grid widget kinds, resolved once when the grid is built
+_KIND_RADIO = 0
+_KIND_INPUT = 1
+_KIND_SELECT = 2
+_WIDGET_KINDS = {RadioSet: _KIND_RADIO, Input: _KIND_INPUT, Select: _KIND_SELECT}
+
+
+def _clip5(value: int) -> int:
+    """Clamp a value to the 0-31 range of a 5-bit field."""
+    return 0 if value < 0 else (value if value <= 0x1F else 0x1F)
+
 
 class Interrogations(Screen):
     """Screen for configuring interrogations with various parameters."""
@@ -32,24 +65,24 @@ class Interrogations(Screen):
     ]
 
     # Constants
-    MODE_S_OPTIONS = [
+    MODE_S_OPTIONS = (
         ("No Mode S Interrogations", 0),
         ("1 Mode S Interrogations", 1),
         ("2 Mode S Interrogations", 2),
         ("3 Mode S Interrogations", 3),
         ("4 Mode S Interrogations", 4),
-    ]
+    )
 
-    POWER_LEVELS = [
+    POWER_LEVELS = (
         ("0 dBm (0000)", 0),
         ("54 dBm (0001)", 1),
         ("57 dBm (0010)", 2),
         ("60 dBm (0011)", 3),
         ("63 dBm (0100)", 4),
         ("66 dBm (0101)", 5),
-    ]
+    )
 
-    PROBABILITY_OF_REPLY = [
+    PROBABILITY_OF_REPLY = (
         ("0: Probability of 1", 0),
         ("1: Probability of 1/2", 1),
         ("2: Probability of 1/4", 2),
@@ -60,17 +93,17 @@ class Interrogations(Screen):
         ("10: No Lockout, Probability of 1/4", 10),
         ("11: No Lockout, Probability of 1/8", 11),
         ("12: No Lockout, Probability of 1/16", 12),
-    ]
+    )
 
-    MODE_S_PROTOCOL = [
+    MODE_S_PROTOCOL = (
         ("0: No Action", 0),
         ("1: Non Selective All Call", 1),
         ("4: Close Out Comm B", 4),
         ("5: Close Out Uplink ELM", 5),
         ("6: Close Out Downlink ELM", 6),
-    ]
+    )
 
-    MODE_S_MES = [
+    MODE_S_MES = (
         ("0: No Action", 0),
         ("1: Uplink ELM Reservation Request", 1),
         ("2: Uplink ELM Closeout", 2),
@@ -79,19 +112,28 @@ class Interrogations(Screen):
         ("5: Upplink Reservation Request/Downlink Closeout", 5),
         ("6: Downlink Reservation Request/Uplink Closeout", 6),
         ("7: Uplink ELM and Downlink Closeouts", 7),
-    ]
+    )
 
-    MODE_S_RSS = [
+    MODE_S_RSS = (
         ("0: No Request", 0),
         ("1: Comm B Reservation", 1),
         ("2: Uplink ELM Reservation", 2),
         ("3: Downlink ELM Reservation", 3)
-    ]
-    def compose(self) -> ComposeResult:
-        """Create child widgets for the screen."""
+    )
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize the interrogations screen.
+
+        The widget tree is built once here rather than in compose, so compose
+        only yields existing widgets and the app's cached instance is reused
+        each time the screen is pushed.
+        """
+        super().__init__(*args, **kwargs)
         self._init_inputs()
         self._init_containers()
-        
+
+    def compose(self) -> ComposeResult:
+        """Create child widgets for the screen."""
         yield Header()
         yield Footer()
         yield from self._compose_main_content()
@@ -105,6 +147,7 @@ class Interrogations(Screen):
                          classes="interrogation-input")
         self.pri = Input(id="pri", placeholder="PRI Length", type="number", 
                        classes="interrogation-input")
+        self._text_inputs = (self.azimuth, self.range, self.pri)
         
         # Checkboxes
         self.mode_s_squitter = Checkbox("Mode S Squitter Enable", id="mode_s_squitter")
@@ -127,12 +170,22 @@ class Interrogations(Screen):
         self.format3 = Checkbox("Format 3", id="format3")
         self.format4 = Checkbox("Format 4", id="format4")
         
+        # Checkbox groups where at most one may be selected
+        self._format_checkboxes = (self.format0, self.format1, self.format2, self.format3, self.format4)
+        self._mxii_checkboxes = (self.mode_3, self.mode_C)
+        self._all_checkboxes = (
+            self.mode_s_squitter,
+            self.popup,
+            self.real_time_test,
+            *self._mxii_checkboxes,
+            *self._format_checkboxes,
+        )
+        
         # Power output
-        radio_buttons = [
-            RadioButton(label, value=value) 
-            for label, value in self.POWER_LEVELS
-        ]
-        self.power_output = RadioSet(*radio_buttons, id="power-output")
+        self.power_output = RadioSet(
+            *(RadioButton(label, value=value) for label, value in self.POWER_LEVELS),
+            id="power-output"
+        )
         
         # Buttons
         self.send_button = Button("Send", id="send")
@@ -195,27 +248,36 @@ class Interrogations(Screen):
             classes="interrogation-right"
         )
 
+        # Mode S grid (widget, kind) pairs by tab prefix and field, filled by _make_mode_s_grid
+        self._tab_widgets: Dict[str, Dict[str, Tuple[Widget, int]]] = {}
+
+        # Only the first tab is built up front; the rest are added when
+        # the number of Mode S interrogations requires them
+        self.tab1 = self._make_mode_s_tab(1)
+
+    def _make_mode_s_tab(self, number: int) -> TabPane:
+        """Create the TabPane for the given Mode S interrogation number."""
+        prefix = f"tab{number}"
         # Each TabPane gets only the VerticalScroll (from _make_mode_s_grid)
-        self.tab1 = TabPane("Mode S Interrogation", self._make_mode_s_grid("tab1"), id="tab1")
-        self.tab2 = TabPane("Mode S Interrogation", self._make_mode_s_grid("tab2"), id="tab2")
-        self.tab3 = TabPane("Mode S Interrogation", self._make_mode_s_grid("tab3"), id="tab3")
-        self.tab4 = TabPane("Mode S Interrogation", self._make_mode_s_grid("tab4"), id="tab4")
+        return TabPane("Mode S Interrogation", self._make_mode_s_grid(prefix), id=prefix)
+
+    def _ensure_mode_s_tabs(self, count: int) -> None:
+        """Add any Mode S tabs up to count that have not been built yet."""
+        tabs = self.query_one("#mode-s-tabs", TabbedContent)
+        for number in range(2, count + 1):
+            if f"tab{number}" not in self._tab_widgets:
+                tabs.add_pane(self._make_mode_s_tab(number))
 
     def _make_mode_s_grid(self, prefix: str):
         """
         Create a 4x5 grid of widgets for a Mode S tab.
         Prefix is used to make widget IDs unique per tab.
         """
-        from textual.containers import Container, VerticalScroll
-        from textual.widgets import Select, Input, RadioSet, RadioButton, Label
-
-        # Helper to make Select options
-        def make_select(options):
-            return [(str(opt), opt) for opt in options]
-        def make_bin_select(start, end, width):
-            return [(format(i, f'0{width}b'), i) for i in range(start, end+1)]
+        tab_widgets = self._tab_widgets.setdefault(prefix, {})
 
         def cell(label, widget):
+            # Keep a direct reference so values can be read without a query
+            tab_widgets[widget.id[len(prefix) + 1:]] = (widget, _WIDGET_KINDS[type(widget)])
             return Container(
                 Label(label),
                 widget,
@@ -224,16 +286,16 @@ class Interrogations(Screen):
 
         widgets = [
             # Row 1
-            cell("Format", Select(make_select([4,5,11,17,20,21]), id=f"{prefix}-format")),
+            cell("Format", Select(_FORMAT_OPTIONS, id=f"{prefix}-format")),
             cell("Aircraft Address", Input(placeholder="Hex", id=f"{prefix}-aircraft-address")),
-            cell("Interrogation Ratio", Select(make_bin_select(0, 10, 4), id=f"{prefix}-interrogation-ratio")),
+            cell("Interrogation Ratio", Select(_INTERROG_RATIO_OPTIONS, id=f"{prefix}-interrogation-ratio")),
             cell("Probability of Reply", Select(self.PROBABILITY_OF_REPLY, id=f"{prefix}-prob-reply")),
-            cell("Code Label", Select(make_bin_select(0, 4, 3), id=f"{prefix}-code-label")),
+            cell("Code Label", Select(_CODE_LABEL_OPTIONS, id=f"{prefix}-code-label")),
             # Row 2
-            cell("Protocol", Select(make_select([0,1,4,5,6]), id=f"{prefix}-protocol")),
+            cell("Protocol", Select(_PROTOCOL_OPTIONS, id=f"{prefix}-protocol")),
             cell("Reply Request", Input(placeholder="Number", id=f"{prefix}-reply-request")),
-            cell("Designator", Select(make_select([0,1,2,3,7]), id=f"{prefix}-designator")),
-            cell("IIS/IC", Select(make_bin_select(0, 15, 4), id=f"{prefix}-iis")),
+            cell("Designator", Select(_DESIGNATOR_OPTIONS, id=f"{prefix}-designator")),
+            cell("IIS/IC", Select(_IIS_OPTIONS, id=f"{prefix}-iis")),
             # Row 3
             cell("MBS", RadioSet(
                 RadioButton("No Comm B", value=1),
@@ -241,19 +303,19 @@ class Interrogations(Screen):
                 RadioButton("Closeout", value=0),
                 id=f"{prefix}-mbs"
             )),
-            cell("MES", Select(make_select(list(range(8))), id=f"{prefix}-mes")),
+            cell("MES", Select(_RANGE8_OPTIONS, id=f"{prefix}-mes")),
             cell("LOS", RadioSet(
                 RadioButton("No Change", value=1),
                 RadioButton("Multisite Lock", value=0),
                 id=f"{prefix}-los"
             )),
-            cell("RSS", Select(make_select(list(range(4))), id=f"{prefix}-rss")),
-            cell("TMS", Select(make_bin_select(0, 15, 4), id=f"{prefix}-tms")),
+            cell("RSS", Select(_RANGE4_OPTIONS, id=f"{prefix}-rss")),
+            cell("TMS", Select(_TMS_OPTIONS, id=f"{prefix}-tms")),
             # Row 4
-            cell("RRS", Select(make_bin_select(0, 15, 4), id=f"{prefix}-rrs")),
-            cell("TCS", Select(make_select(list(range(4))), id=f"{prefix}-tcs")),
-            cell("RCS", Select(make_select(list(range(5))), id=f"{prefix}-rcs")),
-            cell("SAS", Select(make_select(list(range(4))), id=f"{prefix}-sas")),
+            cell("RRS", Select(_RRS_OPTIONS, id=f"{prefix}-rrs")),
+            cell("TCS", Select(_RANGE4_OPTIONS, id=f"{prefix}-tcs")),
+            cell("RCS", Select(_RANGE5_OPTIONS, id=f"{prefix}-rcs")),
+            cell("SAS", Select(_RANGE4_OPTIONS, id=f"{prefix}-sas")),
             cell("SIS", Input(placeholder="Integer", id=f"{prefix}-sis")),
             cell("LSS", RadioSet(
                 RadioButton("No Change", value=1),
@@ -274,54 +336,52 @@ class Interrogations(Screen):
         - mode_s_word: 32-bit integer containing the Mode S data
         - aircraft_address: integer representation of the 6-digit hex aircraft address
         """
+        tab_widgets = self._tab_widgets[prefix]
+
         # Unified helper to get values from any widget type
         def get_widget_value(widget_id, default=0, as_type=int):
             try:
-                w = self.query_one(f"#{prefix}-{widget_id}")
-                from textual.widgets import RadioSet
-                if isinstance(w, RadioSet):
-                    self.notify(f"RadioSet {widget_id} value: {w.pressed_index}")
-                    # RadioSet.value returns the selected RadioButton's value
-                    # If nothing is selected, it returns None
-                    if w.pressed_index is None:
+                w, kind = tab_widgets[widget_id]
+                if kind == _KIND_RADIO:
+                    # pressed_index is -1 when no button is pressed
+                    if w.pressed_index < 0:
                         return default
                     return int(w.pressed_index) if as_type == int else w.value
-                if not hasattr(w, "value") or w.value is None:
+                value = w.value
+                if value is None or value is Select.BLANK:
                     return default
 
                 if as_type == int:
-                    if isinstance(w.value, str):
-                        return int(w.value.strip()) if w.value.strip() else default
-                    return int(w.value)
+                    if kind == _KIND_INPUT:
+                        value = value.strip()
+                        return int(value) if value else default
+                    return int(value)
                 elif as_type == str:
-                    return str(w.value)
-                return w.value
-            except Exception as e:
-                print(f"Error getting value for {widget_id}: {e}")
+                    return str(value)
+                return value
+            except (KeyError, ValueError, AttributeError) as e:
+                logger.warning("Error getting value for %s: %s", widget_id, e)
                 return default
         
-        # Get all values at once
-        values = {
-            "fmt": get_widget_value("format"),
-            "protocol": get_widget_value("protocol"),
-            "reply_request": max(0, min(31, get_widget_value("reply-request"))),
-            "designator": get_widget_value("designator"),
-            "iis": get_widget_value("iis"),
-            "mbs": get_widget_value("mbs"),
-            "mes": get_widget_value("mes"),
-            "los": get_widget_value("los"),
-            "rss": get_widget_value("rss"),
-            "tms": get_widget_value("tms"),
-            "rrs": get_widget_value("rrs"),
-            "tcs": get_widget_value("tcs"),
-            "rcs": get_widget_value("rcs"),
-            "sas": get_widget_value("sas"),
-            "sis": max(0, min(31, get_widget_value("sis"))),
-            "lss": get_widget_value("lss"),
-            "prob_reply": get_widget_value("prob-reply"),
-            "interrogator_code": get_widget_value("iis"),
-            "code_label": get_widget_value("code-label")
-        }
+        # Read every field into a local once
+        fmt = get_widget_value("format")
+        protocol = get_widget_value("protocol")
+        reply_request = _clip5(get_widget_value("reply-request"))
+        designator = get_widget_value("designator")
+        iis = get_widget_value("iis")
+        mbs = get_widget_value("mbs")
+        mes = get_widget_value("mes")
+        los = get_widget_value("los")
+        rss = get_widget_value("rss")
+        tms = get_widget_value("tms")
+        rrs = get_widget_value("rrs")
+        tcs = get_widget_value("tcs")
+        rcs = get_widget_value("rcs")
+        sas = get_widget_value("sas")
+        sis = _clip5(get_widget_value("sis"))
+        lss = get_widget_value("lss")
+        prob_reply = get_widget_value("prob-reply")
+        code_label = get_widget_value("code-label")
         
         # Parse aircraft address as 6-digit hex
         aircraft_address_str = get_widget_value("aircraft-address", "", str).strip()
@@ -330,61 +390,10 @@ class Interrogations(Screen):
         except ValueError:
             aircraft_address = 0
 
-        # Initialize the 32-bit word
-        mode_s_word = 0
-        
-        # Common bits for all formats
-        fmt = values["fmt"]
-        mode_s_word |= (fmt & 0x1F) << 27  # Bits 1-5: format (5 bits)
-        
-        # Format-specific bit packing
-        if fmt in (4, 5, 20, 21):
-            # Bits 6-16: Common for these formats
-            mode_s_word |= (values["protocol"] & 0x7) << 24       # Bits 6-8: protocol (3 bits)
-            mode_s_word |= (values["reply_request"] & 0x1F) << 19 # Bits 9-13: reply_request (5 bits)
-            mode_s_word |= (values["designator"] & 0x7) << 16     # Bits 14-16: designator (3 bits)
-            
-            # Designator-specific bit packing (bits 17-32)
-            designator = values["designator"]
-            
-            # Dictionary of designator handlers
-            designator_handlers = {
-                0: lambda: (values["iis"] & 0xF) << 12,  # Bits 17-20: IIS, rest 0
-                
-                1: lambda: ((values["iis"] & 0xF) << 12) |  # Bits 17-20: IIS
-                           ((values["mbs"] & 0x3) << 10) |  # Bits 21-22: MBS
-                           ((values["mes"] & 0x7) << 7) |   # Bits 23-25: MES
-                           ((values["los"] & 0x1) << 6) |   # Bit 26: LOS
-                           ((values["rss"] & 0x3) << 4) |   # Bits 27-28: RSS
-                           (values["tms"] & 0xF),          # Bits 29-32: TMS
-                
-                2: lambda: ((values["tcs"] & 0x7) << 8) |   # Bits 22-24: TCS (bits 17-21 are 0)
-                           ((values["rcs"] & 0x7) << 5) |   # Bits 25-27: RCS
-                           ((values["sas"] & 0x3) << 3),    # Bits 28-29: SAS (bits 30-32 are 0)
-                
-                3: lambda: ((values["sis"] & 0x1F) << 11) |  # Bits 17-21: SIS
-                           ((values["lss"] & 0x1) << 10) |   # Bit 22: LSS
-                           ((values["rrs"] & 0xF) << 6),     # Bits 23-26: RRS (bits 27-32 are 0)
-                
-                7: lambda: ((values["iis"] & 0xF) << 12) |  # Bits 17-20: IIS
-                           ((values["rrs"] & 0xF) << 8) |   # Bits 21-24: RRS
-                           ((values["los"] & 0x1) << 6) |   # Bit 26: LOS (bit 25 is 0)
-                           (values["tms"] & 0xF)           # Bits 29-32: TMS (bits 27-28 are 0)
-            }
-            
-            # Apply the designator-specific bit packing
-            if designator in designator_handlers:
-                mode_s_word |= designator_handlers[designator]()
-                
-        elif fmt in (11, 17):
-            # Bits 6-16 for formats 11 and 17
-            mode_s_word |= (values["prob_reply"] & 0xF) << 23       # Bits 6-9: probability of reply
-            mode_s_word |= (values["interrogator_code"] & 0xF) << 19 # Bits 10-13: interrogator code
-            mode_s_word |= (values["code_label"] & 0x7) << 16       # Bits 14-16: code label
-            # Bits 17-32 are 0
-            
-        # For any other format, we've already set bits 1-5 with the format
-            
+        mode_s_word = pack_mode_s_word(fmt, protocol, reply_request, designator, iis, mbs, mes,
+                                       los, rss, tms, rrs, tcs, rcs, sas, sis, lss,
+                                       prob_reply, code_label)
+
         return mode_s_word, aircraft_address
 
 
@@ -406,72 +415,61 @@ class Interrogations(Screen):
             yield self.buttons_container
             with TabbedContent(id ='mode-s-tabs'):
                 yield self.tab1
-                yield self.tab2
-                yield self.tab3
-                yield self.tab4
 
     def on_mount(self) -> None:
         """Configure the screen when it's mounted."""
         self.title = "Interrogations"
+        # Watch the reactive so programmatic changes also build the tabs
+        self.watch(self.mode_s_select, "value", self._on_mode_s_count_changed, init=False)
+
+    def _on_mode_s_count_changed(self, count: int) -> None:
+        """Build the Mode S tabs needed for the selected number of interrogations."""
+        if isinstance(count, int):
+            self._ensure_mode_s_tabs(count)
 
     @on(Button.Pressed, "#back")
     def back(self) -> None:
         """Handle back button press - return to previous screen."""
         self.app.pop_screen()
 
-    def _validate_checkbox_selection(self, checkboxes: list) -> bool:
-        """Validate that at most one checkbox is selected from the list."""
-        selected = sum(1 for cb in checkboxes if cb.value)
-        return selected <= 1
+    @staticmethod
+    def _checkbox_mask(checkboxes: Tuple[Checkbox, ...]) -> int:
+        """Return a bitmask with bit i set when checkboxes[i] is selected."""
+        mask = 0
+        for i, cb in enumerate(checkboxes):
+            if cb.value:
+                mask |= 1 << i
+        return mask
 
     @on(Button.Pressed, "#send")
     def send(self) -> None:
         """Handle send button press - send interrogation message."""
-        mode_s_1_enable = False
-        mode_s_2_enable = False
-        mode_s_3_enable = False
-        mode_s_4_enable = False
-        mode_s_data_1 = None
-        mode_s_data_2 = None
-        mode_s_data_3 = None
-        mode_s_data_4 = None
         try:
-            # Validate format checkboxes (only 0 or 1 can be selected)
-            format_checkboxes = [self.format0, self.format1, self.format2, self.format3, self.format4]
-            mxii_checkboxes = [self.mode_3, self.mode_C]
+            # Validate format checkboxes (only 0 or 1 can be selected);
+            # a mask with more than one bit set fails mask & (mask - 1)
+            format_mask = self._checkbox_mask(self._format_checkboxes)
+            mxii_mask = self._checkbox_mask(self._mxii_checkboxes)
             
-            if not self._validate_checkbox_selection(format_checkboxes):
+            if format_mask & (format_mask - 1):
                 self.notify("Error: Only one Format can be selected at a time", severity="error")
                 return
                 
-            if not self._validate_checkbox_selection(mxii_checkboxes):
+            if mxii_mask & (mxii_mask - 1):
                 self.notify("Error: Only one MXII Interrogation can be selected at a time", severity="error")
                 return
             
             # Get selected format (0-4) or None if none selected
-            selected_format = next(
-                (i for i, cb in enumerate(format_checkboxes) if cb.value),
-                None
-            )
+            selected_format = format_mask.bit_length() - 1 if format_mask else None
             
             # Get selected MXII (0 for mode_3, 1 for mode_C) or None if none selected
-            selected_mxii = 0 if self.mode_3.value else (1 if self.mode_C.value else None)
-
-            if self.mode_s_select.value > 0:
-                mode_s_1_enable = True
-                mode_s_data_1 = self.get_mode_s_data("tab1")
-            
-            if self.mode_s_select.value > 1:
-                mode_s_2_enable = True
-                mode_s_data_2 = self.get_mode_s_data("tab2")
+            selected_mxii = mxii_mask.bit_length() - 1 if mxii_mask else None
             
-            if self.mode_s_select.value > 2:
-                mode_s_3_enable = True
-                mode_s_data_3 = self.get_mode_s_data("tab3")
-            
-            if self.mode_s_select.value > 3:
-                mode_s_4_enable = True
-                mode_s_data_4 = self.get_mode_s_data("tab4")
+            # pressed_index is -1 when no power level is selected
+            power_index = self.power_output.pressed_index
+
+            # Read one Mode S tab per selected interrogation
+            mode_s_count = self.mode_s_select.value
+            mode_s_data = [self.get_mode_s_data(f"tab{i}") for i in range(1, mode_s_count + 1)]
             
             # Create the signals dictionary
             signals = {
@@ -483,11 +481,11 @@ class Interrogations(Screen):
                 "PRI_Length": float(self.pri.value) if self.pri.value else 0,
                 "Mode_S_Squitter_Enable": self.mode_s_squitter.value,
                 "POPUP": self.popup.value,
-                "Interrogator_Power_Output": self.power_output.pressed_index or 0,
+                "Interrogator_Power_Output": power_index if power_index >= 0 else 0,
                 "Mode_5_Format": selected_format if selected_format is not None else 0,
                 "SIF_Mode": selected_mxii if selected_mxii is not None else -1,
                 # Derived signals
-                "Mode_S_Interrogation": self.mode_s_select.value != 0,  # True if not "No Mode S Interrogations"
+                "Mode_S_Interrogation": mode_s_count != 0,  # True if not "No Mode S Interrogations"
                 "Mode_5_Interrogation": selected_format is not None,  # True if any format is selected
                 "SIF_Interrogation": selected_mxii is not None,  # True if any MXII is selected
             }
@@ -499,10 +497,11 @@ class Interrogations(Screen):
                 "Modifiers": {}
             }
 
-            # Get the Mode S Interrogation data
-            mode_s_word, aircraft_address = self.get_mode_s_data("tab1")
-            self.notify(f"Mode S Word: {mode_s_word}")
-            self.notify(f"Aircraft Address: {aircraft_address}")
+            # Show the first Mode S Interrogation read above
+            if self.app.debug and mode_s_data:
+                mode_s_word, aircraft_address = mode_s_data[0]
+                self.notify(f"Mode S Word: {mode_s_word}")
+                self.notify(f"Aircraft Address: {aircraft_address}")
 
             # Send the message through the app's TCP client
             if hasattr(self.app, 'send_message') and self.app.send_message(message):
@@ -516,25 +515,16 @@ class Interrogations(Screen):
     @on(Button.Pressed, "#clear")
     def clear(self) -> None:
         """Reset all input fields to their default values."""
-        # Clear text inputs
-        for field in [self.azimuth, self.range, self.pri]:
-            field.value = ""
-        
-        # Reset checkboxes
-        for checkbox in [
-            self.mode_s_squitter,
-            self.popup,
-            self.real_time_test,
-            self.mode_3,
-            self.mode_C,
-            self.format0,
-            self.format1,
-            self.format2,
-            self.format3,
-            self.format4,
-        ]:
-            checkbox.value = False
-        
-        # Reset other inputs
-        self.mode_s_select.value = 0
-        self.power_output.value = ""
\ No newline at end of file
+        # Apply every reset in a single screen update
+        with self.app.batch_update():
+            # Clear text inputs
+            for field in self._text_inputs:
+                field.value = ""
+            
+            # Reset checkboxes
+            for checkbox in self._all_checkboxes:
+                checkbox.value = False
+            
+            # Reset other inputs
+            self.mode_s_select.value = 0
+            self.power_output.value = ""
\ No newline at end of file
@@ -0,0 +1,149 @@
+"""Mode S interrogation word packing.
+
+The packing is plain integer arithmetic with no UI dependencies, so it is kept
+separate from the interrogations screen and fully annotated.
+"""
+
+from typing import Tuple
+
+# (field, mask, shift) entries packed by _pack_fields
+Fields = Tuple[Tuple[int, int, int], ...]
+
+# Positions of the Mode S fields in the tuple passed to _pack_fields
+(_FMT, _PROTOCOL, _REPLY_REQUEST, _DESIGNATOR, _IIS, _MBS, _MES, _LOS, _RSS, _TMS,
+ _RRS, _TCS, _RCS, _SAS, _SIS, _LSS, _PROB_REPLY, _CODE_LABEL) = range(18)
+
+# (field, mask, shift) tables for bits 1-16
+_FMT_ONLY_FIELDS: Fields = (
+    (_FMT, 0x1F, 27),            # Bits 1-5: format
+)
+_FMT_4_5_20_21_FIELDS: Fields = (
+    (_FMT, 0x1F, 27),            # Bits 1-5: format
+    (_PROTOCOL, 0x7, 24),        # Bits 6-8: protocol
+    (_REPLY_REQUEST, 0x1F, 19),  # Bits 9-13: reply request
+    (_DESIGNATOR, 0x7, 16),      # Bits 14-16: designator
+)
+_FMT_11_17_FIELDS: Fields = (
+    (_FMT, 0x1F, 27),            # Bits 1-5: format
+    (_PROB_REPLY, 0xF, 23),      # Bits 6-9: probability of reply
+    (_IIS, 0xF, 19),             # Bits 10-13: interrogator code
+    (_CODE_LABEL, 0x7, 16),      # Bits 14-16: code label (bits 17-32 are 0)
+)
+
+# Bits 1-16 tables indexed by format 0-31; any other format only sets bits 1-5
+_FORMAT_FIELDS: Tuple[Fields, ...] = tuple(
+    _FMT_4_5_20_21_FIELDS if fmt in (4, 5, 20, 21)
+    else _FMT_11_17_FIELDS if fmt in (11, 17)
+    else _FMT_ONLY_FIELDS
+    for fmt in range(32)
+)
+
+# Whether bits 17-32 depend on the designator, indexed by format 0-31
+_HAS_DESIGNATOR: Tuple[bool, ...] = tuple(fmt in (4, 5, 20, 21) for fmt in range(32))
+
+# (field, mask, shift) tables for bits 17-32
+_DESIGNATOR_0_FIELDS: Fields = (
+    (_IIS, 0xF, 12),   # Bits 17-20: IIS, rest 0
+)
+_DESIGNATOR_1_FIELDS: Fields = (
+    (_IIS, 0xF, 12),   # Bits 17-20: IIS
+    (_MBS, 0x3, 10),   # Bits 21-22: MBS
+    (_MES, 0x7, 7),    # Bits 23-25: MES
+    (_LOS, 0x1, 6),    # Bit 26: LOS
+    (_RSS, 0x3, 4),    # Bits 27-28: RSS
+    (_TMS, 0xF, 0),    # Bits 29-32: TMS
+)
+_DESIGNATOR_2_FIELDS: Fields = (
+    (_TCS, 0x7, 8),    # Bits 22-24: TCS (bits 17-21 are 0)
+    (_RCS, 0x7, 5),    # Bits 25-27: RCS
+    (_SAS, 0x3, 3),    # Bits 28-29: SAS (bits 30-32 are 0)
+)
+_DESIGNATOR_3_FIELDS: Fields = (
+    (_SIS, 0x1F, 11),  # Bits 17-21: SIS
+    (_LSS, 0x1, 10),   # Bit 22: LSS
+    (_RRS, 0xF, 6),    # Bits 23-26: RRS (bits 27-32 are 0)
+)
+_DESIGNATOR_7_FIELDS: Fields = (
+    (_IIS, 0xF, 12),   # Bits 17-20: IIS
+    (_RRS, 0xF, 8),    # Bits 21-24: RRS
+    (_LOS, 0x1, 6),    # Bit 26: LOS (bit 25 is 0)
+    (_TMS, 0xF, 0),    # Bits 29-32: TMS (bits 27-28 are 0)
+)
+_DESIGNATOR_NONE_FIELDS: Fields = ()
+
+# Bits 17-32 tables indexed by designator 0-7; any other designator sets none
+_DESIGNATOR_FIELDS: Tuple[Fields, ...] = (
+    _DESIGNATOR_0_FIELDS,
+    _DESIGNATOR_1_FIELDS,
+    _DESIGNATOR_2_FIELDS,
+    _DESIGNATOR_3_FIELDS,
+    _DESIGNATOR_NONE_FIELDS,
+    _DESIGNATOR_NONE_FIELDS,
+    _DESIGNATOR_NONE_FIELDS,
+    _DESIGNATOR_7_FIELDS,
+)
+
+
+def _pack_fields(values: Tuple[int, ...], fields: Fields) -> int:
+    """Pack the masked and shifted fields of values into a single word.
+
+    Args:
+        values: Mode S field values, indexed by the _FMT ... _CODE_LABEL positions
+        fields: (field, mask, shift) entries to pack
+
+    Returns:
+        int: The fields ORed together
+    """
+    word = 0
+    for field, mask, shift in fields:
+        word |= (values[field] & mask) << shift
+    return word
+
+
+def pack_mode_s_word(fmt: int, protocol: int, reply_request: int, designator: int,
+                     iis: int, mbs: int, mes: int, los: int, rss: int, tms: int,
+                     rrs: int, tcs: int, rcs: int, sas: int, sis: int, lss: int,
+                     prob_reply: int, code_label: int) -> int:
+    """Pack Mode S interrogation fields into a 32-bit word.
+
+    The format selects the layout of bits 6-16 and the designator that of
+    bits 17-32. Values outside the tables, such as a format above 31 or a
+    negative designator, select no layout: only their masked bits 1-5 and
+    14-16 are packed.
+
+    Args:
+        fmt: Uplink format
+        protocol: Protocol (formats 4, 5, 20 and 21)
+        reply_request: Reply request (formats 4, 5, 20 and 21)
+        designator: Designator selecting the layout of bits 17-32
+        iis: Interrogator identifier, also used as the interrogator code
+        mbs: Multisite Comm-B subfield
+        mes: Multisite ELM subfield
+        los: Lockout subfield
+        rss: Reservation status subfield
+        tms: Tactical message subfield
+        rrs: Reply request subfield
+        tcs: Type control subfield
+        rcs: Rate control subfield
+        sas: Surface antenna subfield
+        sis: Surveillance identifier subfield
+        lss: Lockout surveillance subfield
+        prob_reply: Probability of reply (formats 11 and 17)
+        code_label: Code label (formats 11 and 17)
+
+    Returns:
+        int: The packed Mode S word
+    """
+    # Field values in _FMT ... _CODE_LABEL order
+    values = (fmt, protocol, reply_request, designator, iis, mbs, mes, los, rss, tms,
+              rrs, tcs, rcs, sas, sis, lss, prob_reply, code_label)
+
+    if not 0 <= fmt < len(_FORMAT_FIELDS):
+        return _pack_fields(values, _FMT_ONLY_FIELDS)
+
+    mode_s_word = _pack_fields(values, _FORMAT_FIELDS[fmt])
+    if _HAS_DESIGNATOR[fmt] and 0 <= designator < len(_DESIGNATOR_FIELDS):
+        mode_s_word |= _pack_fields(values, _DESIGNATOR_FIELDS[designator])
+
+    return mode_s_word
+
@@ -1,27 +1,63 @@
 """Main menu screen for the MCS application."""
 
-import json
 import os
+import platform
 import queue
+import subprocess
 import threading
-from datetime import datetime
+import time
+from collections import deque
+from itertools import islice
 from pathlib import Path
-from typing import ClassVar, Dict, List, Optional, Set, Tuple
+from typing import Callable, ClassVar, Dict, List, Optional, Set, Tuple
 
 from textual import on, work
 from textual.app import ComposeResult
 from textual.containers import Container, VerticalScroll
 from textual.screen import Screen
-from textual.widgets import Button, Checkbox, DataTable, Footer, Header, Input, Label
+from textual.timer import Timer
+from textual.widgets import Button, Checkbox, DataTable, Footer, Header, Input, Label, Static
 
-from config import CSS_CLASSES as CSS, DEFAULT_HOST, DEFAULT_PORT, TABLE_COLUMNS
+from config import (
+    CSS_CLASSES as CSS,
+    DEFAULT_HOST,
+    DEFAULT_PORT,
+    FILE_WRITE_BATCH_SIZE,
+    TABLE_COLUMNS,
+    TABLE_MAX_ROWS,
+    TABLE_REFRESH_INTERVAL,
+)
+from message_handler import MessageHandler
+from serialization import JSONDecodeError, dumps, dumps_pretty, loads
+
+# Opens a directory in the platform's file manager, chosen once at import
+if platform.system() == 'Windows':
+    _open_file_manager: Callable[[str], object] = os.startfile
+else:
+    # "open" on macOS, "xdg-open" on Linux and others
+    _FILE_MANAGER_COMMAND = 'open' if platform.system() == 'Darwin' else 'xdg-open'
+
+    def _open_file_manager(path: str) -> object:
+        """Open a directory in the file manager without waiting for it."""
+        return subprocess.Popen([_FILE_MANAGER_COMMAND, path])
+
+
+# Flushes file data to disk; fdatasync skips metadata where it is available
+_sync = getattr(os, 'fdatasync', os.fsync)
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write all of data to a file descriptor, retrying partial writes."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
 
 
 class Menu(Screen):
     """Main menu screen with navigation and connection controls."""
 
     # Table columns from config
-    TABLE_COLUMNS: ClassVar[List[Tuple[str, str]]] = TABLE_COLUMNS
+    TABLE_COLUMNS: ClassVar[Tuple[Tuple[str, str], ...]] = TABLE_COLUMNS
     
     def __init__(self, *args, **kwargs) -> None:
         """Initialize the main menu screen."""
@@ -32,15 +68,25 @@ class Menu(Screen):
         self.interrogation_button: Optional[Button] = None
         self.save_checkbox: Optional[Checkbox] = None
         self.filename_input: Optional[Input] = None
+        self.detail: Optional[Static] = None
+        
+        # Bound process_message of the app's handler, resolved on mount
+        self._process_message: Optional[Callable[[Dict], Optional[Tuple[str, str, str]]]] = None
+        
+        # Rows waiting to be added on the next table refresh
+        self._pending_rows: deque = deque(maxlen=TABLE_MAX_ROWS)
+        self._flush_timer: Optional[Timer] = None  # Set while rows are waiting
         
         # File handling
-        self._file_queue = queue.Queue()
-        self._file_worker_running = False
+        self._file_queue: queue.SimpleQueue = queue.SimpleQueue()  # None stops the writer thread
+        self._save_enabled = threading.Event()  # Mirrors the save checkbox for the writer thread
         self._file_worker_thread: Optional[threading.Thread] = None
         self._current_file = None
+        self._fd = -1  # Descriptor of _current_file
         self._messages_since_last_flush = 0
         self._last_flush_time = 0
-        self._file_lock = threading.Lock()
+        self._file_lock = threading.RLock()  # Re-entered by _close_file on write errors
+        self._save_dir: Optional[Path] = None
 
     def compose(self) -> ComposeResult:
         """Compose the main menu layout."""
@@ -55,6 +101,7 @@ class Menu(Screen):
         self.table.add_columns(*(col[0] for col in self.TABLE_COLUMNS))
         self.table.cursor_type = "row"
         self.table.zebra_stripes = True
+        self._process_message = getattr(self.app, 'message_handler', MessageHandler).process_message
         
         # Set default connection values
         if self.ip_input and self.port_input:
@@ -73,7 +120,6 @@ class Menu(Screen):
         if self._file_worker_thread and self._file_worker_thread.is_alive():
             return
             
-        self._file_worker_running = True
         self._file_worker_thread = threading.Thread(
             target=self._file_writer_loop,
             daemon=True,
@@ -83,21 +129,31 @@ class Menu(Screen):
     
     def _stop_file_worker(self) -> None:
         """Stop the background file writer thread and clean up."""
-        self._file_worker_running = False
         if self._file_worker_thread and self._file_worker_thread.is_alive():
+            if not self._save_enabled.is_set():
+                self._discard_queued_messages()
+            self._file_queue.put(None)
+            self._save_enabled.set()  # Let the writer reach the sentinel
             self._file_worker_thread.join(timeout=2.0)
         self._close_file()
     
     def _get_save_directory(self) -> Path:
-        """Get or create the save directory."""
-        save_dir = Path.home() / "mcs_saved_data"
-        save_dir.mkdir(exist_ok=True, parents=True)
-        return save_dir
+        """Get or create the save directory, resolved once per screen."""
+        if self._save_dir is None:
+            save_dir = Path.home() / "mcs_saved_data"
+            save_dir.mkdir(exist_ok=True, parents=True)
+            self._save_dir = save_dir
+        return self._save_dir
+    
+    @staticmethod
+    def _default_filename() -> str:
+        """Build a save file name from the current local time."""
+        return "mcs_data_" + time.strftime("%Y%m%d_%H%M%S") + ".jsonl"
     
     def _get_current_filename(self) -> str:
         """Get the current filename from the input field."""
         if not self.filename_input or not self.filename_input.value:
-            return f"mcs_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
+            return self._default_filename()
         return self.filename_input.value
     
     def _open_file(self) -> None:
@@ -110,13 +166,16 @@ class Menu(Screen):
             filename = self._get_current_filename()
             filepath = save_dir / filename
             
-            # Ensure directory exists
-            filepath.parent.mkdir(parents=True, exist_ok=True)
+            # Ensure directory exists when the file name includes subdirectories
+            if filepath.parent != save_dir:
+                filepath.parent.mkdir(parents=True, exist_ok=True)
             
-            # Open in append mode to preserve existing data
-            self._current_file = open(filepath, 'a', buffering=1)  # Line buffered
+            # Open unbuffered in binary append mode to preserve existing data;
+            # batches are written straight to the descriptor
+            self._current_file = open(filepath, 'ab', buffering=0)
+            self._fd = self._current_file.fileno()
             self._messages_since_last_flush = 0
-            self._last_flush_time = datetime.now().timestamp()
+            self._last_flush_time = time.monotonic()
             
         except Exception as e:
             self.notify(f"Error opening save file: {e}", severity="error")
@@ -125,94 +184,121 @@ class Menu(Screen):
     
     def _close_file(self) -> None:
         """Close the current save file."""
-        if self._current_file is not None:
+        with self._file_lock:
+            file = self._current_file
+            if file is None:
+                return
+            # Forget the descriptor before closing it, so the writer can never
+            # write to a descriptor number the OS has already reused
+            self._current_file = None
+            self._fd = -1
             try:
-                with self._file_lock:
-                    self._current_file.flush()
-                    self._current_file.close()
+                file.close()
             except Exception as e:
                 self.notify(f"Error closing save file: {e}", severity="error")
-            finally:
-                self._current_file = None
     
     def _file_writer_loop(self) -> None:
-        """Background thread that writes messages to the save file."""
-        while self._file_worker_running:
-            try:
-                # Get message with timeout to allow thread to be stopped
+        """Background thread that writes messages to the save file.
+        
+        The thread sleeps while saving is disabled and otherwise blocks until
+        a message is queued, then drains whatever else is waiting (up to
+        FILE_WRITE_BATCH_SIZE) and writes it in one call. A None sentinel on
+        the queue stops the thread.
+        """
+        # Bound methods used for every batch, looked up once
+        wait_enabled = self._save_enabled.wait
+        get = self._file_queue.get
+        get_nowait = self._file_queue.get_nowait
+        write_batch = self._write_batch
+        stopping = False
+        while not stopping:
+            wait_enabled()
+            message = get()
+            if message is None:
+                break
+            
+            batch = [message]
+            while len(batch) < FILE_WRITE_BATCH_SIZE:
                 try:
-                    message = self._file_queue.get(timeout=0.5)
+                    message = get_nowait()
                 except queue.Empty:
-                    continue
-                
-                # Only process if saving is enabled
-                if not (self.save_checkbox and self.save_checkbox.value):
-                    continue
-                
-                # Open file if needed
-                if self._current_file is None:
-                    self._open_file()
-                
-                # Write message
-                if self._current_file is not None:
-                    with self._file_lock:
-                        try:
-                            self._current_file.write(json.dumps(message) + '\n')
-                            self._messages_since_last_flush += 1
-                            
-                            # Flush periodically (every 100 messages or 1 second)
-                            current_time = datetime.now().timestamp()
-                            if (self._messages_since_last_flush >= 100 or 
-                                current_time - self._last_flush_time >= 1.0):
-                                self._current_file.flush()
-                                self._messages_since_last_flush = 0
-                                self._last_flush_time = current_time
-                                
-                        except Exception as e:
-                            self.notify(f"Error writing to save file: {e}", severity="error")
-                            self._close_file()
-                            if self.save_checkbox:
-                                self.save_checkbox.value = False
-                
+                    break
+                if message is None:
+                    stopping = True
+                    break
+                batch.append(message)
+            
+            try:
+                write_batch(batch)
             except Exception as e:
                 self.notify(f"Error in file writer: {e}", severity="error")
     
+    def _write_batch(self, batch: List[Dict]) -> None:
+        """Write a batch of messages to the save file as JSON lines."""
+        # Drop messages queued before saving was disabled
+        if not self._save_enabled.is_set():
+            return
+        
+        # Open file if needed
+        if self._current_file is None:
+            self._open_file()
+        
+        # Write messages
+        with self._file_lock:
+            # Re-checked under the lock, as the file may have been closed meanwhile
+            if self._current_file is not None:
+                try:
+                    _write_all(self._fd, b'\n'.join([dumps(message) for message in batch]) + b'\n')
+                    self._messages_since_last_flush += len(batch)
+                    
+                    # Sync to disk periodically (every 100 messages or 1 second)
+                    current_time = time.monotonic()
+                    if (self._messages_since_last_flush >= 100 or 
+                        current_time - self._last_flush_time >= 1.0):
+                        _sync(self._fd)
+                        self._messages_since_last_flush = 0
+                        self._last_flush_time = current_time
+                        
+                except Exception as e:
+                    self.notify(f"Error writing to save file: {e}", severity="error")
+                    self._close_file()
+                    if self.save_checkbox:
+                        self.save_checkbox.value = False
+    
+    def _discard_queued_messages(self) -> None:
+        """Drop messages queued for saving that the writer has not taken yet."""
+        get_nowait = self._file_queue.get_nowait
+        while True:
+            try:
+                get_nowait()
+            except queue.Empty:
+                return
+    
     def _queue_message_for_saving(self, message: Dict) -> None:
         """Add a message to the save queue if saving is enabled."""
-        if self.save_checkbox and self.save_checkbox.value:
-            try:
-                self._file_queue.put_nowait(message)
-            except queue.Full:
-                self.notify("Save queue full, some messages may be lost", severity="warning")
+        if self._save_enabled.is_set():
+            self._file_queue.put(message)
     
     @on(Checkbox.Changed, "#save")
     def on_save_checkbox_changed(self, event: Checkbox.Changed) -> None:
         """Handle save checkbox state changes."""
         if event.value:
+            self._save_enabled.set()
             # Ensure we have a valid filename
             if not self.filename_input or not self.filename_input.value.strip():
-                self.filename_input.value = f"mcs_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
+                self.filename_input.value = self._default_filename()
             self._open_file()
         else:
+            self._save_enabled.clear()
+            # Keep messages from this session out of the next session's file
+            self._discard_queued_messages()
             self._close_file()
     
     @on(Button.Pressed, "#open-save-location")
     def on_open_save_location(self) -> None:
         """Open the save directory in the file explorer."""
         try:
-            save_dir = self._get_save_directory()
-            import platform
-            system = platform.system()
-            
-            if system == 'Windows':
-                import os
-                os.startfile(save_dir)
-            elif system == 'Darwin':  # macOS
-                import subprocess
-                subprocess.Popen(['open', str(save_dir)])
-            else:  # Linux and others
-                import subprocess
-                subprocess.Popen(['xdg-open', str(save_dir)])
+            _open_file_manager(str(self._get_save_directory()))
                 
         except Exception as e:
             self.notify(f"Could not open save location: {e}", severity="error")
@@ -262,7 +348,7 @@ class Menu(Screen):
     def _create_save_container(self) -> VerticalScroll:
         """Create the save options container."""
         self.filename_input = Input(
-            value=f"mcs_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl",
+            value=self._default_filename(),
             placeholder="File Name",
             id="file-name"
         )
@@ -287,9 +373,11 @@ class Menu(Screen):
             id="sidebar"
         )
         
-        # Main content area with data table
+        # Main content area with data table and the selected message below it
+        self.detail = Static(id="message-detail", classes=CSS["bordered_container"], markup=False)
         yield VerticalScroll(
             DataTable(classes=f"{CSS['left_placeholder']} {CSS['bordered_container']}"),
+            self.detail,
             id="content"
         )
 
@@ -310,16 +398,21 @@ class Menu(Screen):
                 self.notify("Port must be between 1 and 65535", severity="error")
                 return
             
-            if hasattr(self.app, 'connect_to_server') and self.app.connect_to_server(host, port):
-                self.query_one("#connect").disabled = True
-                self.query_one("#disconnect").disabled = False
-                self.notify(f"Connected to {host}:{port}", severity="success")
-            else:
-                self.notify("Failed to connect to server", severity="error")
+            self._connect(host, port)
                 
         except ValueError:
             self.notify("Invalid port number", severity="error")
     
+    @work(exclusive=True, group="connect")
+    async def _connect(self, host: str, port: int) -> None:
+        """Connect to the server without blocking the UI."""
+        if hasattr(self.app, 'connect_to_server') and await self.app.connect_to_server(host, port):
+            self.query_one("#connect").disabled = True
+            self.query_one("#disconnect").disabled = False
+            self.notify(f"Connected to {host}:{port}", severity="success")
+        else:
+            self.notify("Failed to connect to server", severity="error")
+    
     @on(Button.Pressed, "#disconnect")
     def on_disconnect_click(self) -> None:
         """Handle disconnect button press."""
@@ -336,11 +429,49 @@ class Menu(Screen):
         if hasattr(self.app, 'push_screen'):
             self.app.push_screen("Interrogations")
     
+    @on(DataTable.RowSelected)
+    def on_row_selected(self, event: DataTable.RowSelected) -> None:
+        """Show the selected message pretty-printed below the table."""
+        raw_data = event.data_table.get_row(event.row_key)[2]
+        try:
+            self.detail.update(dumps_pretty(loads(raw_data)))
+        except JSONDecodeError:
+            self.detail.update(raw_data)
+        self.detail.display = True
+    
+    def _flush_rows(self) -> None:
+        """Add the queued rows to the table and trim it to TABLE_MAX_ROWS.
+        
+        Only the rows pushed out by the new ones are removed, so a tick costs
+        work in proportion to the rows it adds. When the queued rows fill the
+        table on their own, it is cleared instead of removing every row.
+        """
+        self._flush_timer = None
+        pending = self._pending_rows
+        if not pending or not self.table:
+            return
+            
+        table = self.table
+        if len(pending) >= TABLE_MAX_ROWS:
+            table.clear()
+        table.add_rows(pending)
+        pending.clear()
+        
+        # Remove the oldest rows in one pass
+        overflow = table.row_count - TABLE_MAX_ROWS
+        if overflow > 0:
+            for row_key in list(islice(table.rows, overflow)):
+                table.remove_row(row_key)
+    
     # Public Methods
     
     def add_message(self, message: Dict) -> None:
         """Add a message to the data table and optionally save it to a file.
         
+        Rows are queued and added to the table TABLE_REFRESH_INTERVAL after
+        the first of them arrives, so a burst of messages costs one table
+        update and the screen does not wake up while no messages arrive.
+        
         Args:
             message: The message dictionary to add
             
@@ -352,31 +483,18 @@ class Menu(Screen):
             
         try:
             # Process the message for display
-            processed = getattr(self.app, 'message_handler', None).process_message(message)
+            processed = self._process_message(message)
             if not processed:
                 return False
                 
-            message_name, timestamp, raw_data = processed
-            
-            # Add to table
-            self.table.add_row(message_name, timestamp, raw_data)
-            
-            # Limit table size to 250 most recent messages
-            if self.table.row_count > 250:
-                # Remove the first row using the key
-                first_row_key = next(iter(self.table.rows.keys()))
-                self.table.remove_row(first_row_key)
-                
-            # Scroll to the bottom
-            #if self.table.row_count > 0:
-            #    self.table.scroll_to(self.table.row_count - 1)
+            # Queue the row for the next table refresh
+            self._pending_rows.append(processed)
+            if self._flush_timer is None:
+                self._flush_timer = self.set_timer(TABLE_REFRESH_INTERVAL, self._flush_rows)
             
             # Queue message for saving if enabled
             self._queue_message_for_saving(message)
             
-            # Refresh the UI
-            self.refresh()
-            
             return True
             
         except Exception as e:
@@ -1,14 +1,66 @@
 """Message handling for the MCS application."""
-import json
-from datetime import datetime
+import time
 from typing import Dict, Optional, Tuple
 
 from config import TIMESTAMP_FORMAT, TIMESTAMP_PRECISION
+from serialization import dumps_text
+
+# TIMESTAMP_FORMAT up to its trailing "%f", which is formatted separately
+_PREFIX_FORMAT = TIMESTAMP_FORMAT.replace("%f", "")
+
+_NS_PER_SECOND = 1_000_000_000
+_NS_PER_FRACTION_UNIT = 10 ** (9 - TIMESTAMP_PRECISION)
+
+# Prefix of the most recently formatted second, e.g. "HH:MM:SS."
+_last_second: Optional[int] = None
+_last_prefix = ""
+
+
+def format_timestamp_ns(ns: int) -> str:
+    """Format an epoch timestamp as local time with TIMESTAMP_PRECISION digits.
+    
+    The part of TIMESTAMP_FORMAT before "%f" is formatted with time.strftime
+    once per second and cached, so messages arriving within the same second
+    only rebuild the fractional part.
+    
+    Args:
+        ns: Nanoseconds since the epoch, e.g. from time.time_ns()
+        
+    Returns:
+        Timestamp string such as "12:34:56.789"
+    """
+    global _last_second, _last_prefix
+    
+    seconds, fraction = divmod(ns, _NS_PER_SECOND)
+    if seconds != _last_second:
+        _last_prefix = time.strftime(_PREFIX_FORMAT, time.localtime(seconds))
+        _last_second = seconds
+    return _last_prefix + "%0*d" % (TIMESTAMP_PRECISION, fraction // _NS_PER_FRACTION_UNIT)
+
 
 
 class MessageHandler:
     """Handles processing and formatting of incoming messages."""
 
+    __slots__ = ()
+
+    @staticmethod
+    def get_message_name(message: Dict) -> str:
+        """Get the name of a message, supporting both old and new formats.
+        
+        Args:
+            message: Raw message dictionary from the server
+            
+        Returns:
+            The message name, or "Unknown" if the message has none
+        """
+        # Only look up the old "type" key when "MessageName" is missing
+        try:
+            name = message["MessageName"]
+        except KeyError:
+            name = message.get("type", "Unknown")
+        return str(name).strip()
+
     @classmethod
     def process_message(cls, message: Dict) -> Optional[Tuple[str, str, str]]:
         """Process an incoming message and extract relevant information.
@@ -17,7 +69,8 @@ class MessageHandler:
             message: Raw message dictionary from the server
             
         Returns:
-            Optional tuple containing (message_name, timestamp, raw_data) or None if invalid
+            Optional tuple containing (message_name, timestamp, raw_data) or None if invalid,
+            where raw_data is the message as single-line JSON
             
         Raises:
             TypeError: If message is not a dictionary
@@ -27,22 +80,16 @@ class MessageHandler:
             
         try:
             # Extract message name with fallback for both old and new formats
-            message_name = str(message.get("MessageName", message.get("type", "Unknown"))).strip()
+            message_name = cls.get_message_name(message)
             
             # Get current timestamp with millisecond precision
-            timestamp = datetime.now().strftime(TIMESTAMP_FORMAT)
-            timestamp = timestamp[:-(6-TIMESTAMP_PRECISION)]  # Truncate to desired precision
+            timestamp = format_timestamp_ns(time.time_ns())
             
-            # Convert message to pretty-printed JSON
-            raw_data = json.dumps(
-                message,
-                indent=2,
-                default=str,  # Handle non-serializable types
-                ensure_ascii=False  # Support non-ASCII characters
-            )
+            # Convert message to single-line JSON; it is pretty-printed on demand
+            raw_data = dumps_text(message)
             
             return message_name, timestamp, raw_data
             
-        except (TypeError, ValueError, json.JSONEncodeError) as e:
+        except (TypeError, ValueError) as e:
             print(f"Error processing message: {e}")
             return None
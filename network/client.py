@@ -1,47 +1,115 @@
 """TCP client for handling network communication with the server."""
-import json
+import asyncio
 import logging
 import socket
-from queue import Queue
-from typing import Callable, Dict, Optional
+import struct
+from collections import deque
+from typing import BinaryIO, Callable, Deque, Dict, List, Optional
 
-from config import RECEIVE_BUFFER_SIZE, SOCKET_TIMEOUT
+from config import (
+    KEEPALIVE_COUNT,
+    KEEPALIVE_IDLE,
+    KEEPALIVE_INTERVAL,
+    MAX_FRAME_SIZE,
+    MESSAGE_FRAMING,
+    RECEIVE_BUFFER_SIZE,
+    RECEIVE_BUSY_WAIT,
+    SOCKET_TIMEOUT,
+)
+from message_handler import MessageHandler
+from serialization import dumps, loads
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
+logging.basicConfig(level=logging.WARNING)
 logger = logging.getLogger(__name__)
 
+# Message framings: newline-terminated JSON, or JSON preceded by its length
+FRAMING_NEWLINE = "newline"
+FRAMING_LENGTH_PREFIX = "length-prefix"
+_LENGTH_PREFIX = struct.Struct(">I")
+
+# Bytes read per write when the event loop cannot send files with sendfile(2)
+_FILE_CHUNK_SIZE = 64 * 1024
+
+# Quick ACK mode; only available on Linux, where it is not sticky
+_TCP_QUICKACK: Optional[int] = getattr(socket, "TCP_QUICKACK", None)
+
+# Keepalive tunables available on this platform, as (option, value) pairs
+_KEEPALIVE_OPTIONS = tuple(
+    (getattr(socket, name), value)
+    for name, value in (
+        ("TCP_KEEPIDLE", KEEPALIVE_IDLE),
+        ("TCP_KEEPINTVL", KEEPALIVE_INTERVAL),
+        ("TCP_KEEPCNT", KEEPALIVE_COUNT),
+    )
+    if hasattr(socket, name)
+)
+
 
 from typing import Callable, Dict, Optional, Any
 from threading import Thread
-from queue import Queue
+
+def _current_task() -> Optional[asyncio.Task]:
+    """Return the running task, or None outside of the event loop."""
+    try:
+        return asyncio.current_task()
+    except RuntimeError:
+        return None
+
 
 class TCPClient:
     """TCP client that handles connection and message passing with the server."""
 
-    def __init__(self, host: str, port: int, message_callback: Callable[[Dict], Any]):
+    def __init__(self, host: str, port: int, message_callback: Callable[[Dict], Any],
+                 busy_wait: bool = RECEIVE_BUSY_WAIT, framing: str = MESSAGE_FRAMING,
+                 send_error_callback: Optional[Callable[[Exception], Any]] = None):
         """Initialize the TCP client.
         
         Args:
             host: Server hostname or IP address
             port: Server port number
             message_callback: Function to call when a message is received
+            busy_wait: Poll the socket while waiting for data instead of
+                suspending until it is readable. This avoids the wakeup
+                latency of the event loop's selector, but keeps a CPU core
+                busy for as long as the client is connected.
+            framing: FRAMING_NEWLINE to terminate each message with a newline,
+                or FRAMING_LENGTH_PREFIX to precede it with its length as a
+                4-byte big-endian integer
+            send_error_callback: Function to call with the error when queued
+                data fails to send after send_data() has returned
             
         Raises:
-            ValueError: If host is empty or port is out of range
+            ValueError: If host is empty, port is out of range or framing is unknown
         """
         if not host or not isinstance(host, str):
             raise ValueError("Host must be a non-empty string")
         if not isinstance(port, int) or not (0 < port <= 65535):
             raise ValueError("Port must be an integer between 1 and 65535")
+        if framing not in (FRAMING_NEWLINE, FRAMING_LENGTH_PREFIX):
+            raise ValueError(f"Unknown framing {framing!r}")
             
         self.host = host
         self.port = port
         self.message_callback = message_callback
+        # Handlers keyed by message name, tried before message_callback
+        self._dispatch: Dict[str, Callable[[Dict], Any]] = {}
+        self.send_error_callback = send_error_callback
+        self.busy_wait = busy_wait
+        self._length_prefixed = framing == FRAMING_LENGTH_PREFIX
         self.socket: Optional[socket.socket] = None
         self.running = False
-        self.message_queue: Queue[Dict] = Queue()
-        self._buffer = ""  # Buffer for incomplete messages
+        self._parked = False  # Drop received messages while pooled and not in use
+        # Appended and popped without locking; deque operations are atomic
+        self.message_queue: Deque[Dict] = deque()
+        self._buffer = bytearray()  # Received bytes not yet split into messages
+        # Receive buffer allocated once and reused across reconnects
+        self._rx_buf = bytearray(RECEIVE_BUFFER_SIZE)
+        self._rx_view = memoryview(self._rx_buf)
+        # Outbound data the socket could not take yet, written by _writer in order
+        self._tx_pending: List[bytes] = []
+        self._writer: Optional[asyncio.Task] = None
+        self._receiver: Optional[asyncio.Task] = None  # Task running receive_data
         self._message_thread: Optional[Thread] = None
         
         logger.info("TCPClient initialized for %s:%s", host, port)
@@ -60,8 +128,23 @@ class TCPClient:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.socket.settimeout(SOCKET_TIMEOUT)
             self.socket.connect((self.host, self.port))
+            # Outbound frames are already batched, so Nagle's algorithm only adds delay
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # Acknowledge the first segments right away; the kernel falls back
+            # to delayed ACKs on its own shortly after, so this only affects
+            # the start of the connection
+            if _TCP_QUICKACK is not None:
+                self.socket.setsockopt(socket.IPPROTO_TCP, _TCP_QUICKACK, 1)
+            # Keep pooled connections open through idle periods. Unanswered probes
+            # fail the pending receive, which disconnects the client, so a dead
+            # peer shows up in is_alive() even while the client is parked
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            for option, value in _KEEPALIVE_OPTIONS:
+                self.socket.setsockopt(socket.IPPROTO_TCP, option, value)
+            self.socket.setblocking(False)  # Reads are driven by the event loop
             self.running = True
-            self._buffer = ""  # Reset buffer on new connection
+            self._parked = False
+            self.wipe()  # Reset parser state on new connection
             logger.info("Connected to server at %s:%s", self.host, self.port)
             return True
             
@@ -71,12 +154,63 @@ class TCPClient:
             self._cleanup_socket()
             return False
 
+    def is_alive(self) -> bool:
+        """Check whether the client is still connected to the server.
+        
+        Returns:
+            bool: True if the connection is open, False otherwise
+        """
+        return self.running and self.socket is not None
+
+    def set_dispatch(self, table: Dict[str, Callable[[Dict], Any]]) -> None:
+        """Route received messages to handlers by message name.
+        
+        A message whose name has a handler in table is passed to that handler
+        with one dict lookup instead of to message_callback. Messages without
+        a handler still go to message_callback.
+        
+        Args:
+            table: Handlers keyed by message name, as returned by
+                MessageHandler.get_message_name. An empty table sends every
+                message to message_callback.
+        """
+        self._dispatch = dict(table)
+
+    def park(self) -> None:
+        """Keep the connection open but drop the messages it receives.
+
+        The client keeps reading and framing the data, so the connection
+        stays in sync, the server is never blocked by a full receive buffer
+        and a close by the server is still noticed.
+        """
+        self._parked = True
+
+    def unpark(self) -> None:
+        """Pass received messages to the message callback again."""
+        self._parked = False
+
     def disconnect(self) -> None:
-        """Disconnect from the server and clean up resources."""
+        """Disconnect from the server and clean up resources.
+        
+        Data still waiting for the socket to become writable is discarded.
+        """
         self.running = False
+        self._tx_pending.clear()
+        if self._writer is not None:
+            self._writer.cancel()
+            self._writer = None
+        # Wake a receive waiting on the socket, which would not notice it closing
+        receiver, self._receiver = self._receiver, None
+        if receiver is not None and receiver is not _current_task():
+            receiver.cancel()
         self._cleanup_socket()
+        self.wipe()
         logger.info("Disconnected from server")
 
+    def wipe(self) -> None:
+        """Discard any partially received message, keeping the receive buffer."""
+        self._buffer.clear()
+
     def _cleanup_socket(self) -> None:
         """Safely close and clean up the socket."""
         if self.socket:
@@ -88,6 +222,19 @@ class TCPClient:
             finally:
                 self.socket = None
 
+    def frame(self, payload: bytes) -> bytes:
+        """Frame an encoded message for sending with this client's framing.
+        
+        Args:
+            payload: JSON encoded message
+            
+        Returns:
+            bytes: The framed message
+        """
+        if self._length_prefixed:
+            return _LENGTH_PREFIX.pack(len(payload)) + payload
+        return payload + b"\n"
+
     def send_message(self, message: Dict) -> bool:
         """Send a JSON message to the server.
         
@@ -95,7 +242,7 @@ class TCPClient:
             message: Dictionary to be sent as JSON
             
         Returns:
-            bool: True if message was sent successfully, False otherwise
+            bool: True if the message was sent or queued, False otherwise
             
         Raises:
             ValueError: If message is not a dictionary
@@ -103,55 +250,293 @@ class TCPClient:
         if not isinstance(message, dict):
             raise ValueError("Message must be a dictionary")
             
+        try:
+            data = self.frame(dumps(message))
+        except (TypeError, ValueError) as e:
+            logger.error("Failed to encode message: %s", e)
+            return False
+            
+        return self.send_data(data)
+
+    def send_messages(self, messages: List[Dict]) -> bool:
+        """Send several JSON messages to the server in a single write.
+        
+        A burst larger than the socket's send buffer is written in part and
+        the rest queued, see send_data().
+        
+        Args:
+            messages: Dictionaries to be sent as JSON, in order
+            
+        Returns:
+            bool: True if the messages were sent or queued, False otherwise
+            
+        Raises:
+            ValueError: If any message is not a dictionary
+        """
+        if not all(isinstance(message, dict) for message in messages):
+            raise ValueError("Messages must be dictionaries")
+            
+        try:
+            data = b"".join([self.frame(dumps(message)) for message in messages])
+        except (TypeError, ValueError) as e:
+            logger.error("Failed to encode message: %s", e)
+            return False
+            
+        if not data:
+            return True
+        return self.send_data(data)
+
+    def send_data(self, data: bytes) -> bool:
+        """Send pre-encoded frames to the server.
+        
+        The data is written straight away as far as the socket's send buffer
+        allows. Whatever does not fit is written in order by a task on the
+        running event loop once the socket is writable again, so a full
+        buffer never blocks the caller or splits a frame. Must be called from
+        the event loop thread.
+        
+        Args:
+            data: Bytes containing one or more complete frames, see frame()
+            
+        Returns:
+            bool: True if the data was sent or queued, False otherwise
+        """
         if not self.socket or not self.running:
             logger.warning("Cannot send message - not connected to server")
             return False
             
-        try:
-            message_str = json.dumps(message, ensure_ascii=False) + "\n"
-            self.socket.sendall(message_str.encode('utf-8'))
+        # Keep the order of data queued behind an earlier partial write
+        if self._writer is not None:
+            self._tx_pending.append(data)
             return True
             
-        except (socket.error, json.JSONEncodeError) as e:
+        try:
+            sent = self.socket.send(data)
+        except BlockingIOError:
+            sent = 0
+        except socket.error as e:
             logger.error("Failed to send message: %s", e)
             self.disconnect()
             return False
+            
+        if sent < len(data):
+            self._tx_pending.append(memoryview(data)[sent:])
+            self._writer = asyncio.get_running_loop().create_task(self._write_pending())
+        return True
 
-    def receive_data(self) -> None:
-        """Receive and process data from the server in a non-blocking way."""
-        if not self.running or not self.socket:
-            return
+    async def _write_pending(self) -> bool:
+        """Write the queued outbound data, waiting for the socket to be writable.
+        
+        Returns:
+            bool: True if all queued data was written, False otherwise
+        """
+        loop = asyncio.get_running_loop()
+        pending = self._tx_pending
+        try:
+            while pending:
+                data = b"".join(pending)
+                pending.clear()
+                await loop.sock_sendall(self.socket, data)
+            return True
+        except socket.error as e:
+            self._write_failed(e)
+            return False
+        finally:
+            if self._writer is asyncio.current_task():
+                self._writer = None
+
+    def _write_failed(self, error: Exception) -> None:
+        """Close the connection after a write from the writer task failed."""
+        if self._writer is asyncio.current_task():
+            self._writer = None  # Do not let disconnect cancel the failing task
+        if self.running:
+            logger.error("Failed to send message: %s", error)
+            self.disconnect()
+            if self.send_error_callback:
+                self.send_error_callback(error)
+
+    async def send_file(self, path: str) -> bool:
+        """Send the contents of a file to the server without copying it through Python.
+        
+        On Linux the default event loop sends the file with sendfile(2),
+        straight from the page cache; loops without sock_sendfile, such as
+        uvloop, send it in chunks instead. The file is sent as is, so it must
+        already contain complete frames, see frame(). Data queued before the
+        call is written first, and data sent during it is queued behind the
+        file, so frames are never interleaved with it.
+        
+        Args:
+            path: Path of the file to send
+            
+        Returns:
+            bool: True if the file was sent successfully, False otherwise
+        """
+        if not self.socket or not self.running:
+            logger.warning("Cannot send file - not connected to server")
+            return False
             
         try:
-            while True:  # Process all available data
+            file = open(path, 'rb')
+        except OSError as e:
+            logger.error("Failed to open file %s: %s", path, e)
+            return False
+            
+        # Wait for earlier writes, then hold the write side until the file is sent
+        while self._writer is not None:
+            await asyncio.wait({self._writer})
+        if not self.socket or not self.running:
+            file.close()
+            return False
+        writer = self._writer = asyncio.get_running_loop().create_task(self._write_file(file))
+        await asyncio.wait({writer})
+        return not writer.cancelled() and writer.result()
+
+    async def _write_file(self, file: BinaryIO) -> bool:
+        """Write a file to the socket, then any data queued meanwhile.
+        
+        Args:
+            file: Open file to send, closed once it has been sent
+            
+        Returns:
+            bool: True if the file and the queued data were written, False otherwise
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            with file:
                 try:
-                    data = self.socket.recv(RECEIVE_BUFFER_SIZE)
-                    if not data:
-                        logger.info("Connection closed by server")
-                        self.disconnect()
-                        break
-                        
-                    self._buffer += data.decode('utf-8', errors='replace')
-                    self._process_buffer()
-                    
-                except socket.timeout:
-                    # No more data available
-                    break
-                    
-        except (socket.error, ConnectionResetError) as e:
-            logger.error("Network error: %s", e)
-            self.disconnect()
+                    await loop.sock_sendfile(self.socket, file)
+                except NotImplementedError:
+                    while chunk := file.read(_FILE_CHUNK_SIZE):
+                        await loop.sock_sendall(self.socket, chunk)
+        except socket.error as e:
+            self._write_failed(e)
+            return False
+        return await self._write_pending()
+
+    async def receive_data(self) -> None:
+        """Receive and process data from the server until the connection closes.
+
+        The coroutine suspends on the event loop until the socket is readable,
+        so no time is spent polling while the server is quiet, unless the
+        client was created with busy_wait.
+        """
+        loop = asyncio.get_running_loop()
+        self._receiver = asyncio.current_task()
+        while self.running and self.socket:
+            try:
+                if self.busy_wait and not self._parked:
+                    received = await self._poll_recv_into()
+                else:
+                    received = await loop.sock_recv_into(self.socket, self._rx_view)
+            except (socket.error, ConnectionResetError) as e:
+                if self.running:
+                    logger.error("Network error: %s", e)
+                    self.disconnect()
+                break
+
+            if not received:
+                logger.info("Connection closed by server")
+                self.disconnect()
+                break
+
+            self._buffer += self._rx_view[:received]
+            self._process_buffer()
             
+    async def _poll_recv_into(self) -> int:
+        """Receive into the receive buffer, polling until data is available.
+        
+        The event loop is yielded to between polls, so the UI keeps running.
+        
+        Returns:
+            int: Number of bytes received, 0 if the server closed the connection
+        """
+        sock = self.socket
+        view = self._rx_view
+        while True:
+            try:
+                return sock.recv_into(view)
+            except BlockingIOError:
+                await asyncio.sleep(0)
+
     def _process_buffer(self) -> None:
-        """Process the receive buffer and extract complete messages."""
-        while "\n" in self._buffer:
-            message_str, self._buffer = self._buffer.split("\n", 1)
-            if not message_str.strip():
+        """Process the receive buffer and extract complete messages.
+
+        Newline-terminated lines are split off the front of the byte buffer
+        and passed to loads undecoded. The connection is closed if an
+        unterminated line grows beyond MAX_FRAME_SIZE.
+        """
+        if self._length_prefixed:
+            self._process_length_prefixed_buffer()
+            return
+            
+        buffer = self._buffer
+        find = buffer.find
+        handle_payload = self._handle_payload
+        while True:
+            end = find(b"\n")
+            if end < 0:
+                if len(buffer) > MAX_FRAME_SIZE:
+                    self._frame_too_large(len(buffer))
+                break
+            # loads accepts the bytearray slice, so it is not copied to bytes
+            line = buffer[:end]
+            del buffer[:end + 1]
+            # isspace() checks blank lines without copying them like strip()
+            if not line or line.isspace():
                 continue
-                
-            try:
-                message = json.loads(message_str)
-                if self.message_callback and isinstance(message, dict):
-                    self.message_callback(message)
-            except json.JSONDecodeError as e:
-                logger.warning("Invalid JSON received: %s - %s", message_str, e)
+            handle_payload(line)
+
+    def _process_length_prefixed_buffer(self) -> None:
+        """Extract complete length-prefixed messages from the receive buffer.
+
+        The length is read from the 4-byte prefix, so the payload is sliced
+        off without scanning it and may contain literal newlines. A length
+        beyond MAX_FRAME_SIZE means the stream is out of sync or not length
+        prefixed at all, so the connection is closed.
+        """
+        buffer = self._buffer
+        prefix_size = _LENGTH_PREFIX.size
+        unpack_from = _LENGTH_PREFIX.unpack_from
+        handle_payload = self._handle_payload
+        while len(buffer) >= prefix_size:
+            (length,) = unpack_from(buffer)
+            if length > MAX_FRAME_SIZE:
+                self._frame_too_large(length)
+                break
+            end = prefix_size + length
+            if len(buffer) < end:
+                break
+            payload = buffer[prefix_size:end]
+            del buffer[:end]
+            handle_payload(payload)
+
+    def _frame_too_large(self, size: int) -> None:
+        """Close the connection after receiving a frame larger than MAX_FRAME_SIZE."""
+        logger.error("Received frame of %d bytes exceeds the %d byte limit - disconnecting",
+                     size, MAX_FRAME_SIZE)
+        self.disconnect()
+
+    def _handle_payload(self, payload: bytearray) -> None:
+        """Parse a received JSON payload and pass it to its handler.
+
+        The message goes to its handler from set_dispatch() if there is one,
+        and to the message callback otherwise. Payloads that are not valid JSON or not valid UTF-8 are logged and
+        dropped, as are all payloads received while the client is parked.
+        """
+        if self._parked:
+            return
+        try:
+            message = loads(payload)
+        except ValueError as e:
+            # json raises UnicodeDecodeError for invalid UTF-8, orjson JSONDecodeError
+            logger.warning("Invalid JSON received: %s - %s", payload, e)
+            return
+        if not isinstance(message, dict):
+            return
+        if self._dispatch:
+            handler = self._dispatch.get(MessageHandler.get_message_name(message))
+            if handler is not None:
+                handler(message)
+                return
+        if self.message_callback:
+            self.message_callback(message)
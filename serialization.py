@@ -0,0 +1,55 @@
+"""JSON serialization for the MCS application.
+
+Uses orjson when it is installed and falls back to the standard library
+json module otherwise. Both backends produce UTF-8 encoded bytes from dumps,
+single-line text from dumps_text and indented text from dumps_pretty.
+"""
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError is a subclass of json.JSONDecodeError
+JSONDecodeError = json.JSONDecodeError
+
+if orjson is not None:
+    _DUMPS_OPTIONS: int = orjson.OPT_NON_STR_KEYS
+    _PRETTY_OPTIONS: int = orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize an object to compact UTF-8 encoded JSON."""
+        return orjson.dumps(obj, option=_DUMPS_OPTIONS)
+
+    def dumps_text(obj: Any) -> str:
+        """Serialize an object to compact single-line JSON text, for display.
+
+        Values that are not JSON serializable are written using str().
+        """
+        return orjson.dumps(obj, default=str, option=_DUMPS_OPTIONS).decode('utf-8')
+
+    def dumps_pretty(obj: Any) -> str:
+        """Serialize an object to JSON indented by two spaces, for display.
+
+        Values that are not JSON serializable are written using str().
+        """
+        return orjson.dumps(obj, default=str, option=_PRETTY_OPTIONS).decode('utf-8')
+
+    loads = orjson.loads
+
+else:
+    _encode = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False).encode
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize an object to compact UTF-8 encoded JSON."""
+        return _encode(obj).encode('utf-8')
+
+    # Values that are not JSON serializable are written using str()
+    dumps_text = json.JSONEncoder(
+        separators=(',', ':'), default=str, ensure_ascii=False
+    ).encode
+    dumps_pretty = json.JSONEncoder(indent=2, default=str, ensure_ascii=False).encode
+
+    loads = json.loads